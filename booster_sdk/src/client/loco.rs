@@ -20,6 +20,44 @@ use serde::{Deserialize, Serialize};
 use serde_json::json;
 use typed_builder::TypedBuilder;
 
+/// Request body for `Move`.
+#[derive(Serialize)]
+struct MoveParameter {
+    vx: f32,
+    vy: f32,
+    vyaw: f32,
+}
+
+/// Request body for `RotateHead`.
+#[derive(Serialize)]
+struct RotateHeadParameter {
+    pitch: f32,
+    yaw: f32,
+}
+
+/// Request body for `MoveHandEndEffector`.
+///
+/// Serialized directly from borrowed postures instead of going through an
+/// intermediate `serde_json::Value` tree.
+#[derive(Serialize)]
+struct MoveHandEndEffectorParameter<'a> {
+    target_posture: &'a crate::types::Posture,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    aux_posture: Option<&'a crate::types::Posture>,
+    time_millis: i32,
+    hand_index: i32,
+    has_aux: bool,
+    new_version: bool,
+}
+
+/// Request body for `ControlDexterousHand`.
+#[derive(Serialize)]
+struct ControlDexterousHandParameter<'a> {
+    finger_params: &'a [DexterousFingerParameter],
+    hand_index: i32,
+    hand_type: i32,
+}
+
 /// High-level client for B1 locomotion control and telemetry.
 pub struct BoosterClient {
     rpc: RpcClient,
@@ -83,14 +121,16 @@ impl BoosterClient {
 
     /// Move the robot base in body frame.
     pub async fn move_robot(&self, vx: f32, vy: f32, vyaw: f32) -> Result<()> {
-        let param = json!({ "vx": vx, "vy": vy, "vyaw": vyaw }).to_string();
-        self.rpc.call_void(LocoApiId::Move, param).await
+        let param = MoveParameter { vx, vy, vyaw };
+        self.rpc.call_serialized(LocoApiId::Move, &param).await
     }
 
     /// Rotate the head to absolute pitch/yaw angles.
     pub async fn rotate_head(&self, pitch: f32, yaw: f32) -> Result<()> {
-        let param = json!({ "pitch": pitch, "yaw": yaw }).to_string();
-        self.rpc.call_void(LocoApiId::RotateHead, param).await
+        let param = RotateHeadParameter { pitch, yaw };
+        self.rpc
+            .call_serialized(LocoApiId::RotateHead, &param)
+            .await
     }
 
     /// Trigger a right-hand wave action.
@@ -153,17 +193,16 @@ impl BoosterClient {
         time_millis: i32,
         hand_index: HandIndex,
     ) -> Result<()> {
-        let param = json!({
-            "target_posture": target_posture,
-            "aux_posture": aux_posture,
-            "time_millis": time_millis,
-            "hand_index": i32::from(hand_index),
-            "has_aux": true,
-            "new_version": false,
-        })
-        .to_string();
+        let param = MoveHandEndEffectorParameter {
+            target_posture,
+            aux_posture: Some(aux_posture),
+            time_millis,
+            hand_index: i32::from(hand_index),
+            has_aux: true,
+            new_version: false,
+        };
         self.rpc
-            .call_void(LocoApiId::MoveHandEndEffector, param)
+            .call_serialized(LocoApiId::MoveHandEndEffector, &param)
             .await
     }
 
@@ -174,16 +213,16 @@ impl BoosterClient {
         time_millis: i32,
         hand_index: HandIndex,
     ) -> Result<()> {
-        let param = json!({
-            "target_posture": target_posture,
-            "time_millis": time_millis,
-            "hand_index": i32::from(hand_index),
-            "has_aux": false,
-            "new_version": false,
-        })
-        .to_string();
+        let param = MoveHandEndEffectorParameter {
+            target_posture,
+            aux_posture: None,
+            time_millis,
+            hand_index: i32::from(hand_index),
+            has_aux: false,
+            new_version: false,
+        };
         self.rpc
-            .call_void(LocoApiId::MoveHandEndEffector, param)
+            .call_serialized(LocoApiId::MoveHandEndEffector, &param)
             .await
     }
 
@@ -194,16 +233,16 @@ impl BoosterClient {
         time_millis: i32,
         hand_index: HandIndex,
     ) -> Result<()> {
-        let param = json!({
-            "target_posture": target_posture,
-            "time_millis": time_millis,
-            "hand_index": i32::from(hand_index),
-            "has_aux": false,
-            "new_version": true,
-        })
-        .to_string();
+        let param = MoveHandEndEffectorParameter {
+            target_posture,
+            aux_posture: None,
+            time_millis,
+            hand_index: i32::from(hand_index),
+            has_aux: false,
+            new_version: true,
+        };
         self.rpc
-            .call_void(LocoApiId::MoveHandEndEffector, param)
+            .call_serialized(LocoApiId::MoveHandEndEffector, &param)
             .await
     }
 
@@ -261,14 +300,13 @@ impl BoosterClient {
         hand_index: HandIndex,
         hand_type: BoosterHandType,
     ) -> Result<()> {
-        let param = json!({
-            "finger_params": finger_params,
-            "hand_index": i32::from(hand_index),
-            "hand_type": i32::from(hand_type),
-        })
-        .to_string();
+        let param = ControlDexterousHandParameter {
+            finger_params,
+            hand_index: i32::from(hand_index),
+            hand_type: i32::from(hand_type),
+        };
         self.rpc
-            .call_void(LocoApiId::ControlDexterousHand, param)
+            .call_serialized(LocoApiId::ControlDexterousHand, &param)
             .await
     }
 
@@ -521,3 +559,119 @@ impl GripperCommand {
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::{
+        ControlDexterousHandParameter, MoveHandEndEffectorParameter, MoveParameter,
+        RotateHeadParameter,
+    };
+    use crate::types::{DexterousFingerParameter, Orientation, Position, Posture};
+    use serde_json::json;
+
+    fn posture() -> Posture {
+        Posture {
+            position: Position {
+                x: 0.25,
+                y: -0.5,
+                z: 1.0,
+            },
+            orientation: Orientation {
+                roll: 0.0,
+                pitch: 0.5,
+                yaw: -0.25,
+            },
+        }
+    }
+
+    #[test]
+    fn velocity_parameters_match_json_layout() {
+        let param = MoveParameter {
+            vx: 0.5,
+            vy: 0.0,
+            vyaw: -0.25,
+        };
+        assert_eq!(
+            serde_json::to_value(&param).unwrap(),
+            json!({ "vx": 0.5, "vy": 0.0, "vyaw": -0.25 })
+        );
+
+        let param = RotateHeadParameter {
+            pitch: 0.25,
+            yaw: -0.5,
+        };
+        assert_eq!(
+            serde_json::to_value(&param).unwrap(),
+            json!({ "pitch": 0.25, "yaw": -0.5 })
+        );
+    }
+
+    #[test]
+    fn move_hand_end_effector_parameter_matches_json_layout() {
+        let target = posture();
+        let param = MoveHandEndEffectorParameter {
+            target_posture: &target,
+            aux_posture: None,
+            time_millis: 1000,
+            hand_index: 1,
+            has_aux: false,
+            new_version: true,
+        };
+
+        let expected = json!({
+            "target_posture": target,
+            "time_millis": 1000,
+            "hand_index": 1,
+            "has_aux": false,
+            "new_version": true,
+        });
+        assert_eq!(serde_json::to_value(&param).unwrap(), expected);
+    }
+
+    #[test]
+    fn move_hand_end_effector_parameter_includes_aux_posture() {
+        let target = posture();
+        let aux = posture();
+        let param = MoveHandEndEffectorParameter {
+            target_posture: &target,
+            aux_posture: Some(&aux),
+            time_millis: 500,
+            hand_index: 0,
+            has_aux: true,
+            new_version: false,
+        };
+
+        let value = serde_json::to_value(&param).unwrap();
+        assert_eq!(value["aux_posture"], json!(aux));
+    }
+
+    #[test]
+    fn control_dexterous_hand_parameter_matches_json_layout() {
+        let fingers = [
+            DexterousFingerParameter {
+                seq: 0,
+                angle: 500,
+                force: 200,
+                speed: 800,
+            },
+            DexterousFingerParameter {
+                seq: 1,
+                angle: 1000,
+                force: 200,
+                speed: 800,
+            },
+        ];
+        let param = ControlDexterousHandParameter {
+            finger_params: &fingers,
+            hand_index: 0,
+            hand_type: 2,
+        };
+
+        let expected = json!({
+            "finger_params": fingers,
+            "hand_index": 0,
+            "hand_type": 2,
+        });
+        assert_eq!(serde_json::to_value(&param).unwrap(), expected);
+    }
+}
@@ -1,5 +1,6 @@
 //! DDS runtime helpers for creating publishers and subscriptions.
 
+use futures::StreamExt;
 use serde::{Serialize, de::DeserializeOwned};
 use std::net::{IpAddr, Ipv4Addr};
 use tokio::sync::mpsc;
@@ -79,29 +80,25 @@ impl DdsNode {
     where
         T: DeserializeOwned + Send + 'static,
     {
-        let topic = spec.create_topic(&self.participant)?;
-        let reader = self
-            .subscriber
-            .create_datareader_no_key_cdr::<T>(&topic, Some(spec.qos.clone()))
-            .map_err(|err| DdsError::SubscriberCreationFailed {
-                topic: spec.name.to_string(),
-                reason: err.to_string(),
-            })?;
+        let reader = self.subscribe_reader::<T>(spec)?;
 
         let (sender, receiver) = mpsc::channel(buffer);
         std::thread::spawn(move || {
-            let mut reader = reader;
-            loop {
-                match reader.take_next_sample() {
-                    Ok(Some(sample)) => {
-                        if sender.blocking_send(sample.into_value()).is_err() {
-                            break;
+            // Wake on the reader's data-available notification instead of
+            // polling, so samples are forwarded as soon as they arrive.
+            let mut samples = reader.async_sample_stream();
+            futures::executor::block_on(async move {
+                while let Some(result) = samples.next().await {
+                    match result {
+                        Ok(sample) => {
+                            if sender.send(sample.into_value()).await.is_err() {
+                                break;
+                            }
                         }
+                        Err(_) => std::thread::sleep(std::time::Duration::from_millis(10)),
                     }
-                    Ok(None) => std::thread::sleep(std::time::Duration::from_millis(5)),
-                    Err(_) => std::thread::sleep(std::time::Duration::from_millis(10)),
                 }
-            }
+            });
         });
 
         Ok(DdsSubscription { receiver })
@@ -123,6 +123,10 @@ fn normalize_service_topic(service_topic: &str) -> String {
     trimmed.to_owned()
 }
 
+fn request_header(api_id: i32) -> String {
+    format!(r#"{{"api_id":{api_id}}}"#)
+}
+
 fn preview_for_log(value: &str, max_chars: usize) -> String {
     let mut preview = String::new();
     let mut chars = value.chars();
@@ -260,8 +264,8 @@ impl RpcClient {
 
         let request_id = Uuid::new_v4().to_string();
         let body = body.into();
-        let header = serde_json::json!({ "api_id": api_id }).to_string();
-        let service_topic = self.service_topic.clone();
+        let header = request_header(api_id);
+        let service_topic = self.service_topic.as_str();
 
         tracing::debug!(
             target: "booster_sdk::rpc",
@@ -377,7 +381,9 @@ impl RpcClient {
 
 #[cfg(test)]
 mod tests {
-    use super::{decode_response_body, parse_status_from_header, parse_status_value};
+    use super::{
+        decode_response_body, parse_status_from_header, parse_status_value, request_header,
+    };
     use serde_json::json;
 
     #[derive(serde::Deserialize)]
@@ -402,6 +408,16 @@ mod tests {
         assert_eq!(parse_status_from_header(r#"{"code":0}"#), None);
     }
 
+    #[test]
+    fn request_header_matches_json_encoding() {
+        for api_id in [0, 2001, -1, i32::MAX] {
+            assert_eq!(
+                request_header(api_id),
+                json!({ "api_id": api_id }).to_string()
+            );
+        }
+    }
+
     #[test]
     fn empty_body_deserializes_as_empty_object() {
         let _: EmptyResponse = decode_response_body("").expect("empty body should parse");
@@ -2,4 +2,14 @@
 
 from __future__ import annotations
 
+import importlib
+from types import ModuleType
+
 __all__ = ["client"]
+
+
+def __getattr__(name: str) -> ModuleType:
+    # Load submodules on first attribute access so `import booster_sdk` stays cheap.
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
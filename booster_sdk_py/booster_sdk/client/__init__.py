@@ -2,4 +2,14 @@
 
 from __future__ import annotations
 
+import importlib
+from types import ModuleType
+
 __all__ = ["ai", "booster", "light_control", "lui", "vision", "x5_camera"]
+
+
+def __getattr__(name: str) -> ModuleType:
+    # Each client module imports the native bindings; only load the ones used.
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -519,7 +519,7 @@ impl From<Action> for PyAction {
     }
 }
 
-#[pyclass(module = "booster_sdk_bindings", name = "GripperCommand")]
+#[pyclass(module = "booster_sdk_bindings", name = "GripperCommand", frozen)]
 #[derive(Clone)]
 pub struct PyGripperCommand(GripperCommand);
 
@@ -761,7 +761,7 @@ impl From<Posture> for PyPosture {
     }
 }
 
-#[pyclass(module = "booster_sdk_bindings", name = "Quaternion")]
+#[pyclass(module = "booster_sdk_bindings", name = "Quaternion", frozen)]
 #[derive(Clone, Copy)]
 pub struct PyQuaternion(Quaternion);
 
@@ -806,7 +806,7 @@ impl From<Quaternion> for PyQuaternion {
     }
 }
 
-#[pyclass(module = "booster_sdk_bindings", name = "Transform")]
+#[pyclass(module = "booster_sdk_bindings", name = "Transform", frozen)]
 #[derive(Clone, Copy)]
 pub struct PyTransform(Transform);
 
@@ -845,7 +845,11 @@ impl From<Transform> for PyTransform {
     }
 }
 
-#[pyclass(module = "booster_sdk_bindings", name = "GripperMotionParameter")]
+#[pyclass(
+    module = "booster_sdk_bindings",
+    name = "GripperMotionParameter",
+    frozen
+)]
 #[derive(Clone, Copy)]
 pub struct PyGripperMotionParameter(GripperMotionParameter);
 
@@ -889,7 +893,11 @@ impl From<PyGripperMotionParameter> for GripperMotionParameter {
     }
 }
 
-#[pyclass(module = "booster_sdk_bindings", name = "DexterousFingerParameter")]
+#[pyclass(
+    module = "booster_sdk_bindings",
+    name = "DexterousFingerParameter",
+    frozen
+)]
 #[derive(Clone, Copy)]
 pub struct PyDexterousFingerParameter(DexterousFingerParameter);
 
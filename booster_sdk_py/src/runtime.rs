@@ -17,15 +17,18 @@ pub(crate) fn get_tokio_runtime() -> &'static Runtime {
 
 /// `f` should do very little work besides spawning tasks and awaiting them.
 ///
+/// The GIL is released while blocking, so other Python threads keep running
+/// (and can issue their own requests) during the RPC round trip.
+///
 /// See [this] for more information.
 ///
 /// [this]: https://docs.rs/tokio/latest/tokio/runtime/struct.Runtime.html#non-worker-future
 #[tracing::instrument(level = "trace", skip_all)]
-pub fn wait_for_future<F>(_: Python<'_>, f: F) -> F::Output
+pub fn wait_for_future<F>(py: Python<'_>, f: F) -> F::Output
 where
     F: Future + Send + 'static,
     F::Output: Send + 'static,
 {
     let runtime: &Runtime = get_tokio_runtime();
-    runtime.block_on(f)
+    py.detach(|| runtime.block_on(f))
 }
@@ -4,12 +4,27 @@ Requirements:
 - `pip install cyclonedds`
 """
 
+import os
+import sys
+import time
 from dataclasses import dataclass
 from typing import List
 
+from cyclonedds.core import (
+    InstanceState,
+    ReadCondition,
+    SampleState,
+    ViewState,
+    WaitSet,
+)
 from cyclonedds.domain import DomainParticipant
+from cyclonedds.qos import Policy, Qos
 from cyclonedds.sub import DataReader
 from cyclonedds.topic import Topic
+from cyclonedds.util import duration
+
+# Print at most this often; every sample is still taken from the reader.
+LOG_INTERVAL_SEC = 0.1
 
 
 @dataclass
@@ -50,17 +65,50 @@ class RobotStatusDdsMsg:
 def main() -> None:
     participant = DomainParticipant(0)
     topic = Topic(participant, "rt/device_gateway", RobotStatusDdsMsg)
-    reader = DataReader(participant, topic)
-
-    print("Listening for rt/device_gateway...")
+    # Device status is state, not events: match the SDK's best-effort keep-last-1
+    # QoS so a slow reader only ever holds the newest sample.
+    qos = Qos(Policy.Reliability.BestEffort, Policy.History.KeepLast(1))
+    reader = DataReader(participant, topic, qos=qos)
+
+    # Block until samples arrive instead of spinning on an empty reader.
+    waitset = WaitSet(participant)
+    waitset.attach(
+        ReadCondition(reader, SampleState.Any | ViewState.Any | InstanceState.Any)
+    )
+
+    # Bind the per-iteration callables and the timeout once, outside the loop.
+    wait = waitset.wait
+    take = reader.take
+    write = os.write
+    stdout_fd = sys.stdout.fileno()
+    forever = duration(infinite=True)
+    monotonic = time.monotonic
+    last_log = 0.0
+
+    print("Listening for rt/device_gateway...", flush=True)
     while True:
-        samples = reader.take(10)
-        for sample in samples:
-            if not sample.data:
-                continue
-            msg = sample.data
-            for joint in msg.joint_vec:
-                print(f"{joint.name}: {joint.temperature}C")
+        wait(forever)
+
+        # Drain everything queued, but only print the newest status: older
+        # samples in the same burst are already stale.
+        msg = None
+        while samples := take(32):
+            for sample in samples:
+                if sample.data:
+                    msg = sample.data
+        if msg is None:
+            continue
+
+        now = monotonic()
+        if now - last_log < LOG_INTERVAL_SEC:
+            continue
+        last_log = now
+
+        # One write(2) per status message, bypassing the sys.stdout buffer.
+        lines = "".join(
+            f"{joint.name}: {joint.temperature}C\n" for joint in msg.joint_vec
+        )
+        write(stdout_fd, lines.encode())
 
 
 if __name__ == "__main__":
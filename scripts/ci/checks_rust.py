@@ -1,20 +1,46 @@
 #!/usr/bin/env python3
 """CI script for Rust checks: clippy and tests."""
 
+import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+def target_dir(cmd: list[str]) -> str:
+    # Separate target dirs per cargo subcommand so concurrent steps do not
+    # block each other on the build directory lock.
+    base = Path(os.environ.get("CARGO_TARGET_DIR", "target"))
+    return str(base / cmd[1])
 
 
 def run(cmd: list[str]) -> bool:
-    print(f"\n{'=' * 60}")
-    print(f"Running: {' '.join(cmd)}")
-    print(f"{'=' * 60}\n")
-    result = subprocess.run(cmd)
-    if result.returncode != 0:
-        print(f"\n✗ Failed: {' '.join(cmd)}")
-    else:
-        print(f"\n✓ Passed: {' '.join(cmd)}")
-    return result.returncode == 0
+    name = cmd[1]
+    env = {**os.environ, "CARGO_TARGET_DIR": target_dir(cmd)}
+    print(
+        f"\n{'=' * 60}\nRunning: {' '.join(cmd)}\n{'=' * 60}\n",
+        flush=True,
+    )
+
+    # Stream output as it is produced, tagged with the step so concurrent
+    # logs can be told apart.
+    with subprocess.Popen(
+        cmd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    ) as proc:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            sys.stdout.write(f"[{name}] {line}")
+            sys.stdout.flush()
+
+    status = "✓ Passed" if proc.returncode == 0 else "✗ Failed"
+    print(f"\n{status}: {' '.join(cmd)}", flush=True)
+    return proc.returncode == 0
 
 
 def main() -> int:
@@ -23,10 +49,10 @@ def main() -> int:
         ["cargo", "test", "--all-targets", "--all-features"],
     ]
 
-    failed = []
-    for cmd in steps:
-        if not run(cmd):
-            failed.append(cmd)
+    with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+        results = list(zip(steps, executor.map(run, steps)))
+
+    failed = [cmd for cmd, ok in results if not ok]
 
     print(f"\n{'=' * 60}")
     if failed: